@@ -1,5 +1,5 @@
 import os
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # Read the long description from the README file
 with open(os.path.join(os.path.dirname(__file__), "README.md"), encoding="utf-8") as f:
@@ -8,7 +8,7 @@ with open(os.path.join(os.path.dirname(__file__), "README.md"), encoding="utf-8"
 setup(
     name="vl-csv-viewer",  # Changed package name to be more descriptive
     version="0.4.7",  # Bumped version for min-width and ellipsis improvements
-    packages=find_packages(),
+    packages=["vl"],
     entry_points={
         "console_scripts": [
             "vl=vl.cli:main",
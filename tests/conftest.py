@@ -0,0 +1,8 @@
+"""Pytest configuration for the VL test suite."""
+
+import os
+import sys
+
+# Add parent directory to path to allow imports; done once here rather than
+# in every test module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -1,14 +1,14 @@
 """Tests for the CLI module."""
 
 import os
-import sys
 import unittest
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path to allow imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from vl.cli import parse_args, main, _get_parser
 
-from vl.cli import parse_args, main
+
+# Resolved once for the module rather than in every setUp
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
 
 
 class TestCLI(unittest.TestCase):
@@ -16,7 +16,7 @@ class TestCLI(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+        self.fixtures_dir = FIXTURES_DIR
         self.small_fixture = os.path.join(self.fixtures_dir, 'small.csv')
         self.large_fixture = os.path.join(self.fixtures_dir, 'large.csv')
 
@@ -66,6 +66,16 @@ class TestCLI(unittest.TestCase):
         with self.assertRaises(SystemExit):
             parse_args([self.small_fixture, '-s', 'invalid'])
 
+    def test_parser_is_reused(self):
+        """Test that the argument parser is built once and reused."""
+        self.assertIs(_get_parser(), _get_parser())
+        
+        # Reusing the parser must not leak values between calls
+        first = parse_args([self.small_fixture, '-s', 'simple'])
+        second = parse_args([self.small_fixture])
+        self.assertEqual(first.style, 'simple')
+        self.assertEqual(second.style, 'grid')
+
     @patch('vl.cli.view_csv')
     def test_main_success(self, mock_view_csv):
         """Test successful execution of main function."""
@@ -135,6 +145,20 @@ class TestCLI(unittest.TestCase):
         # Should return 1 on error
         self.assertEqual(result, 1)
 
+    @patch('vl.cli._discard_stdout')
+    @patch('vl.cli.view_csv')
+    @patch('sys.stderr')
+    def test_main_broken_pipe(self, mock_stderr, mock_view_csv, mock_discard):
+        """Test main function when the output pipe is closed early."""
+        mock_view_csv.side_effect = BrokenPipeError()
+        
+        result = main([self.small_fixture])
+        
+        # Closing the pipe (e.g. `| head`) is not an error
+        self.assertEqual(result, 0)
+        mock_discard.assert_called_once()
+        mock_stderr.write.assert_not_called()
+
     @patch('vl.cli.view_csv')
     @patch('sys.stderr')
     def test_main_generic_error(self, mock_stderr, mock_view_csv):
@@ -242,7 +266,3 @@ class TestCLI(unittest.TestCase):
         # Check if semicolon was used despite the .csv extension
         mock_view_csv.assert_called_once()
         self.assertEqual(mock_view_csv.call_args[1]['delimiter'], ';')
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
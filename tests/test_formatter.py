@@ -1,27 +1,43 @@
 """Tests for the formatter module."""
 
+import csv
 import io
 import os
-import sys
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
-
-# Add parent directory to path to allow imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch
 
 from vl.formatter import CSVViewer, view_csv
 
 
+# Resolved once for the module rather than in every setUp
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
 class TestCSVViewer(unittest.TestCase):
     """Tests for the CSVViewer class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.fixtures_dir = os.path.join(os.path.dirname(__file__), 'fixtures')
+        self.fixtures_dir = FIXTURES_DIR
         self.small_fixture = os.path.join(self.fixtures_dir, 'small.csv')
         self.large_fixture = os.path.join(self.fixtures_dir, 'large.csv')
+        self.quoted_fixture = os.path.join(self.fixtures_dir, 'quoted.csv')
         self.output = io.StringIO()  # Capture output
 
+    def _stdlib_rows(self, path, delimiter=','):
+        """Parse a file with the stdlib csv reader for comparison."""
+        with open(path, 'r', newline='') as f:
+            return list(csv.reader(f, delimiter=delimiter))
+
+    def _write_temp(self, data):
+        """Write raw bytes to a temporary file and return its path."""
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        self.addCleanup(os.remove, path)
+        return path
+
     def test_init_with_defaults(self):
         """Test initialization with default values."""
         viewer = CSVViewer()
@@ -48,6 +64,21 @@ class TestCSVViewer(unittest.TestCase):
         self.assertEqual(viewer.border_style, 'grid')
         self.assertEqual(viewer.output_stream, self.output)
 
+    @patch('vl.formatter.shutil.get_terminal_size')
+    def test_terminal_size_probed_lazily(self, mock_get_terminal_size):
+        """Test that the terminal size is probed once, on first access."""
+        mock_get_terminal_size.return_value = os.terminal_size((120, 40))
+        viewer = CSVViewer()
+        mock_get_terminal_size.assert_not_called()
+        
+        self.assertEqual(viewer.term_width, 120)
+        self.assertEqual(viewer.term_height, 40)
+        mock_get_terminal_size.assert_called_once()
+        
+        # Explicit values take precedence over the probe
+        viewer.term_width = 40
+        self.assertEqual(viewer.term_width, 40)
+
     def test_border_chars(self):
         """Test border characters for different styles."""
         # Simple style
@@ -78,6 +109,10 @@ class TestCSVViewer(unittest.TestCase):
         self.assertEqual(border_chars['v'], ' ')
         self.assertEqual(border_chars['tl'], ' ')
 
+        # Each viewer gets its own copy of the shared style table
+        border_chars['h'] = '='
+        self.assertEqual(CSVViewer(border_style='none').border_chars['h'], ' ')
+
         # Invalid style falls back to simple
         viewer = CSVViewer(border_style='invalid')
         border_chars = viewer._get_border_chars()
@@ -85,6 +120,12 @@ class TestCSVViewer(unittest.TestCase):
         self.assertEqual(border_chars['v'], '|')
         self.assertEqual(border_chars['tl'], '+')
 
+    def test_border_chars_single_width(self):
+        """Test that every border character is a single character."""
+        for style, chars in CSVViewer.BORDER_STYLES.items():
+            for name, char in chars.items():
+                self.assertEqual(len(char), 1, f"{style}[{name!r}] is {char!r}")
+
     def test_truncate_cell(self):
         """Test cell truncation."""
         viewer = CSVViewer()
@@ -107,6 +148,18 @@ class TestCSVViewer(unittest.TestCase):
         formatted = viewer._format_row(row, col_widths)
         self.assertEqual(formatted, "| Name   | Age | City   |")
 
+    def test_format_row_ragged(self):
+        """Test that short and long rows are fitted to the column widths."""
+        viewer = CSVViewer(border_style='simple')
+        col_widths = [6, 3, 6]
+        
+        self.assertEqual(viewer._format_row(['Name'], col_widths), "| Name   |     |        |")
+        self.assertEqual(viewer._format_row(['Name', 'Age', 'City', 'Extra'], col_widths),
+                         "| Name   | Age | City   |")
+        
+        # The template follows changes to the column widths
+        self.assertEqual(viewer._format_row(['Name', 'Age'], [4, 4]), "| Name | Age  |")
+
     def test_format_separator(self):
         """Test separator formatting."""
         viewer = CSVViewer(border_style='simple')
@@ -129,6 +182,36 @@ class TestCSVViewer(unittest.TestCase):
         formatted = viewer._format_separator(col_widths, 'top')
         self.assertEqual(formatted, "")
 
+    def test_format_separator_cached(self):
+        """Test that separators are built once per widths and position."""
+        viewer = CSVViewer(border_style='grid')
+        top = viewer._format_separator([6, 3], 'top')
+        
+        self.assertIs(viewer._format_separator((6, 3), 'top'), top)
+        self.assertEqual(viewer._format_separator([6, 3], 'bottom'), "└────────┴─────┘")
+        self.assertEqual(viewer._format_separator([6, 4], 'top'), "┌────────┬──────┐")
+
+    def test_settings_changed_after_init(self):
+        """Test that border and color settings changed later still apply."""
+        output = io.StringIO()
+        viewer = CSVViewer(output_stream=output, header=False)
+        viewer.view_csv(io.StringIO('a\n'))
+        self.assertIn("| a |", output.getvalue())
+        
+        viewer.border_chars['v'] = '!'
+        viewer.border_chars['h'] = '='
+        output.seek(0)
+        output.truncate()
+        viewer.view_csv(io.StringIO('a\n'))
+        self.assertIn("! a !", output.getvalue())
+        self.assertIn("+===+", output.getvalue())
+        
+        viewer.use_colors = True
+        output.seek(0)
+        output.truncate()
+        viewer.view_csv(io.StringIO('a\n'))
+        self.assertIn("!\033[46m a \033[0m!", output.getvalue())
+
     @patch('sys.stdout', new_callable=io.StringIO)
     def test_view_csv_with_file(self, mock_stdout):
         """Test viewing a CSV file."""
@@ -245,36 +328,47 @@ class TestCSVViewer(unittest.TestCase):
             # The outputs should be different because of the header formatting
             self.assertNotEqual(output, header_output)
 
-    @patch('vl.formatter.CSVViewer')
-    def test_view_csv_function(self, mock_csv_viewer):
+    def test_view_csv_function(self):
         """Test the view_csv convenience function."""
-        # Set up the mock
-        mock_instance = MagicMock()
-        mock_csv_viewer.return_value = mock_instance
-        
-        # Call the function
-        view_csv(
-            file_path=self.small_fixture,
-            delimiter=';',
-            header=False,
-            min_col_width=10,
-            max_col_width=20,
-            border_style='grid'
-        )
-        
-        # Check if CSVViewer was initialized with the correct parameters
-        mock_csv_viewer.assert_called_once_with(
+        class FakeViewer:
+            """Records how the convenience function drives the viewer."""
+            instances = []
+            
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+                self.viewed = []
+                FakeViewer.instances.append(self)
+            
+            def view_csv(self, file_input):
+                self.viewed.append(file_input)
+        
+        with patch('vl.formatter.CSVViewer', FakeViewer):
+            view_csv(
+                file_path=self.small_fixture,
+                delimiter=';',
+                header=False,
+                min_col_width=10,
+                max_col_width=20,
+                border_style='grid'
+            )
+        
+        # Check if CSVViewer was initialized once with the correct parameters
+        self.assertEqual(len(FakeViewer.instances), 1)
+        fake = FakeViewer.instances[0]
+        self.assertEqual(fake.kwargs, dict(
             delimiter=';',
             header=False,
             min_col_width=10,
             max_col_width=20,
             border_style='grid',
             use_colors=False,
-            column_colors=None
-        )
+            column_colors=None,
+            ignore_comments=False,
+            comment_pattern='^#',
+        ))
         
         # Check if view_csv was called on the instance
-        mock_instance.view_csv.assert_called_once_with(self.small_fixture)
+        self.assertEqual(fake.viewed, [self.small_fixture])
 
     def test_column_width_consistency(self):
         """Test that all cells in a column have the same width."""
@@ -399,6 +493,225 @@ class TestCSVViewer(unittest.TestCase):
         reset_count = formatted.count('\033[0m')
         self.assertEqual(reset_count, 3)  # One reset for each column
 
+    def test_mmap_reader_matches_csv_module(self):
+        """Test that the memory-mapped reader parses like csv.reader."""
+        viewer = CSVViewer()
+        for path in (self.small_fixture, self.large_fixture, self.quoted_fixture):
+            self.assertEqual(list(viewer._csv_reader(path)), self._stdlib_rows(path))
+
+    def test_mmap_reader_quoted_fields(self):
+        """Test quoted delimiters, escaped quotes and embedded newlines."""
+        viewer = CSVViewer()
+        rows = list(viewer._csv_reader(self.quoted_fixture))
+        self.assertEqual(rows[1], ['Alice', 'Likes commas, lots of them', 'New York'])
+        self.assertEqual(rows[2], ['Bob', 'Said "hi" twice', 'Paris'])
+        self.assertEqual(rows[3], ['Charlie', 'Wrote a\nmulti-line note', 'Tokyo'])
+        self.assertEqual(rows[4], [])
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    def test_mmap_reader_line_endings(self):
+        """Test CRLF and CR line endings and a missing final newline."""
+        viewer = CSVViewer()
+        for data in (b'a,b\r\nc,d\r\n', b'a,b\rc,d\r', b'a,b\nc,d', b'a,"b\r\nc"\r\nd,e\r\n'):
+            path = self._write_temp(data)
+            self.assertEqual(list(viewer._csv_reader(path)), self._stdlib_rows(path))
+
+    def test_mmap_reader_mid_field_quotes(self):
+        """Test quotes in the middle of unquoted fields, which are literal."""
+        viewer = CSVViewer()
+        path = self._write_temp(b'name,note\nTV,55" screen\nx,"line one\nline two"')
+        self.assertEqual(list(viewer._csv_reader(path)),
+                         [['name', 'note'], ['TV', '55" screen'], ['x', 'line one\nline two']])
+        
+        plain = b'a,b\n' * 50
+        for data in (plain + b'TV,55" screen\n' + plain + b'x,"line one\nline two"\n' + plain,
+                     plain + b'5" s,"q,"\n' + plain,
+                     b'"a","b ""c"""\n' * 50 + plain):
+            path = self._write_temp(data)
+            for block_size in (1, 3, 7, 64, 1 << 20):
+                viewer.READ_BLOCK_SIZE = block_size
+                self.assertEqual(list(viewer._csv_reader(path)), self._stdlib_rows(path))
+
+    def test_non_utf8_locale_uses_text_reader(self):
+        """Test that files are decoded with a non-UTF-8 locale encoding."""
+        viewer = CSVViewer()
+        with patch('vl.formatter.locale.getpreferredencoding', return_value='latin-1'), \
+                patch.object(viewer, '_mmap_reader') as mmap_reader:
+            self.assertEqual(list(viewer._csv_reader(self.small_fixture)),
+                             self._stdlib_rows(self.small_fixture))
+        mmap_reader.assert_not_called()
+
+    def test_mmap_reader_empty_file(self):
+        """Test that empty files, which cannot be mapped, yield no rows."""
+        viewer = CSVViewer()
+        path = self._write_temp(b'')
+        self.assertEqual(list(viewer._csv_reader(path)), [])
+
+    def test_mmap_reader_block_boundaries(self):
+        """Test records that straddle block boundaries, inside and outside quotes."""
+        viewer = CSVViewer()
+        viewer.READ_BLOCK_SIZE = 7
+        for path in (self.small_fixture, self.quoted_fixture):
+            self.assertEqual(list(viewer._csv_reader(path)), self._stdlib_rows(path))
+
+    def test_preview_keeps_following_row(self):
+        """Test that the row after the preview is left for the caller."""
+        viewer = CSVViewer()
+        reader = iter([[str(i), 'x' * i] for i in range(150)])
+        
+        col_widths, preview_rows = viewer._calculate_initial_col_widths(reader, num_preview_rows=100)
+        
+        self.assertEqual(len(preview_rows), 100)
+        self.assertEqual(col_widths, [2, 99])
+        self.assertEqual(next(reader), ['100', 'x' * 100])
+
+    def test_sample_rows(self):
+        """Test that column widths come from the first sample_rows rows."""
+        path = self._write_temp(b'a,b\n1,2\n333,4\n')
+        output = io.StringIO()
+        viewer = CSVViewer(output_stream=output, sample_rows=2)
+        viewer.view_csv(path)
+        
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "+---+---+")
+        self.assertEqual(lines[4], "| 333 | 4 |")
+        self.assertIn("Total rows: 3", lines[-1])
+
+    def test_stream_reader_matches_csv_module(self):
+        """Test that piped input read in blocks parses like csv.reader."""
+        for path in (self.small_fixture, self.quoted_fixture):
+            with open(path, 'rb') as f:
+                data = f.read()
+            for block_size in (7, 1 << 20):
+                viewer = CSVViewer()
+                viewer.READ_BLOCK_SIZE = block_size
+                stream = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', newline='')
+                self.assertEqual(list(viewer._csv_reader(stream)), self._stdlib_rows(path))
+
+    def test_stream_reader_mid_field_quotes(self):
+        """Test that piped input with literal mid-field quotes is not held back."""
+        plain = b'a,b\n' * 50
+        data = plain + b'TV,55" screen\n' + plain + b'x,"line one\nline two"\n' + plain
+        expected = list(csv.reader(io.StringIO(data.decode(), newline='')))
+        for block_size in (1, 3, 7, 64, 1 << 20):
+            viewer = CSVViewer()
+            viewer.READ_BLOCK_SIZE = block_size
+            self.assertEqual(list(viewer._stream_reader(io.BytesIO(data))), expected)
+        
+        # The stray quote must not hold later rows back until end of input
+        class Pipe:
+            """Hands out one chunk per read() call, like a pipe."""
+            def __init__(self, chunks):
+                self.chunks = list(chunks)
+            
+            def read(self, size):
+                return self.chunks.pop(0) if self.chunks else b''
+        
+        pipe = Pipe([b'TV,55" screen\n', b'a,b\n', b'c,d\n'])
+        rows = CSVViewer()._stream_reader(pipe)
+        self.assertEqual(next(rows), ['TV', '55" screen'])
+        self.assertEqual(next(rows), ['a', 'b'])
+        self.assertEqual(len(pipe.chunks), 1)
+
+    def test_stream_reader_text_only_input(self):
+        """Test that text streams without a byte buffer are read as text."""
+        viewer = CSVViewer()
+        stream = io.StringIO('a,"b,c"\nd,e\n')
+        self.assertEqual(list(viewer._csv_reader(stream)), [['a', 'b,c'], ['d', 'e']])
+        
+        data = 'a,b\n' * 50 + 'TV,55" screen\nx,"line one\nline two"\n' + '"a","b"\n' * 50
+        expected = list(csv.reader(io.StringIO(data, newline='')))
+        for block_size in (1, 3, 7, 64, 1 << 20):
+            viewer.READ_BLOCK_SIZE = block_size
+            self.assertEqual(list(viewer._csv_reader(io.StringIO(data))), expected)
+
+    def test_stream_reader_partly_read_stream(self):
+        """Test that rows already read ahead by the text layer are not lost."""
+        path = self._write_temp(''.join(f'x{i},y{i}\n' for i in range(2000)).encode())
+        viewer = CSVViewer()
+        with open(path, newline='') as f:
+            f.readline()
+            rows = list(viewer._csv_reader(f))
+        self.assertEqual(len(rows), 1999)
+        self.assertEqual(rows[0], ['x1', 'y1'])
+        
+        # A stream nothing has been read from yet still takes the byte path
+        with open(path, newline='') as f, \
+                patch.object(viewer, '_text_stream_reader') as text_stream_reader:
+            self.assertEqual(len(list(viewer._csv_reader(f))), 2000)
+        text_stream_reader.assert_not_called()
+
+    def test_stream_reader_does_not_wait_for_full_block(self):
+        """Test that piped rows are parsed as soon as they arrive."""
+        class SlowPipe:
+            """Hands out one chunk per read1() call, like a pipe."""
+            def __init__(self, chunks):
+                self.chunks = list(chunks)
+            
+            def read1(self, size):
+                return self.chunks.pop(0) if self.chunks else b''
+            
+            def read(self, size):
+                raise AssertionError("read() waits for a full block")
+        
+        pipe = SlowPipe([b'a,b\n1,', b'2\n', b'3,"x\ny"\n'])
+        rows = CSVViewer()._stream_reader(pipe)
+        
+        self.assertEqual(next(rows), ['a', 'b'])
+        self.assertEqual(len(pipe.chunks), 2)
+        self.assertEqual(list(rows), [['1', '2'], ['3', 'x\ny']])
+
+    def test_split_block_sparse_quotes(self):
+        """Test blocks where only a few records are quoted."""
+        viewer = CSVViewer()
+        plain = 'a,b,c\n' * 20
+        for text in (plain + 'x,"y,\nz",w\n' + plain,
+                     plain + 'stray"quote,b\n' + plain,
+                     plain + '"a ""quoted"" word",b\n'):
+            expected = list(csv.reader(io.StringIO(text, newline='')))
+            self.assertEqual(list(viewer._split_block(text)), expected)
+
+    def test_render_rows_in_batches(self):
+        """Test that batching writes does not change the rendered output."""
+        expected = io.StringIO()
+        CSVViewer(output_stream=expected).view_csv(self.large_fixture)
+        
+        output = io.StringIO()
+        viewer = CSVViewer(output_stream=output)
+        viewer.WRITE_BATCH_ROWS = 4
+        viewer.view_csv(self.large_fixture)
+        
+        self.assertEqual(output.getvalue(), expected.getvalue())
+        self.assertIn("Total rows: 29", output.getvalue())
+
+    def test_render_rows_shows_slow_input_as_it_comes(self):
+        """Test that rows are written before the stream reader waits for more."""
+        output = io.StringIO()
+        
+        class SlowPipe:
+            """Hands out one chunk per read1() call, recording the output so far."""
+            def __init__(self, chunks):
+                self.chunks = list(chunks)
+                self.seen = []
+            
+            def read1(self, size):
+                self.seen.append(output.getvalue())
+                return self.chunks.pop(0) if self.chunks else b''
+            
+            def read(self, size):
+                raise AssertionError("read() waits for a full block")
+        
+        class Stdin:
+            """Text stream over the slow pipe, like sys.stdin."""
+            encoding = 'utf-8'
+            errors = 'strict'
+            buffer = SlowPipe([b'n,v\n', b'1,one\n', b'2,two\n'])
+        
+        viewer = CSVViewer(output_stream=output, sample_rows=1)
+        with patch('sys.stdin', Stdin):
+            viewer.view_csv(Stdin)
+        
+        seen = Stdin.buffer.seen
+        self.assertEqual(len(seen), 4)
+        self.assertIn("| one ", seen[2])
+        self.assertIn("| two ", seen[3])
+        self.assertIn("Total rows: 3", output.getvalue())
@@ -0,0 +1,76 @@
+"""Tests for the pager module."""
+
+import io
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+from vl.pager import PIPE_SIZE, _grow_pipe, _pager_command, main
+
+
+class TestPager(unittest.TestCase):
+    """Tests for the pager module."""
+
+    @patch('vl.pager.subprocess.Popen')
+    @patch('vl.pager.cli.main', return_value=0)
+    @patch('vl.pager.sys.stdout')
+    def test_no_pager_when_not_a_tty(self, mock_stdout, mock_cli_main, mock_popen):
+        """Test that redirected output bypasses less."""
+        mock_stdout.isatty.return_value = False
+        
+        result = main(['data.csv'])
+        
+        self.assertEqual(result, 0)
+        mock_cli_main.assert_called_once_with(['data.csv'])
+        mock_popen.assert_not_called()
+
+    @patch('vl.pager.subprocess.Popen')
+    @patch('vl.pager.cli.main', return_value=0)
+    @patch('vl.pager.sys.stdout')
+    @patch.dict(os.environ, {'PAGER': 'cat'})
+    def test_no_pager_when_pager_is_cat(self, mock_stdout, mock_cli_main, mock_popen):
+        """Test that PAGER=cat bypasses the pager on a terminal."""
+        mock_stdout.isatty.return_value = True
+        
+        self.assertEqual(main(['data.csv']), 0)
+        mock_popen.assert_not_called()
+
+    @patch('vl.pager.cli.main', return_value=0)
+    @patch('vl.pager.sys.stderr', new_callable=io.StringIO)
+    @patch('vl.pager.sys.stdout')
+    @patch.dict(os.environ, {'PAGER': 'no-such-pager-vl'})
+    def test_missing_pager_falls_back(self, mock_stdout, mock_stderr, mock_cli_main):
+        """Test that a mistyped $PAGER is reported and the output still shown."""
+        mock_stdout.isatty.return_value = True
+        
+        self.assertEqual(main(['data.csv']), 0)
+        mock_cli_main.assert_called_once_with(['data.csv'])
+        self.assertIn("no-such-pager-vl", mock_stderr.getvalue())
+
+    def test_pager_command(self):
+        """Test how the pager command is taken from $PAGER."""
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(_pager_command(), ['less', '-SR'])
+        with patch.dict(os.environ, {'PAGER': '/usr/bin/less -i'}):
+            self.assertEqual(_pager_command(), ['/usr/bin/less', '-i', '-SR'])
+        with patch.dict(os.environ, {'PAGER': 'more'}):
+            self.assertEqual(_pager_command(), ['more'])
+        with patch.dict(os.environ, {'PAGER': ''}):
+            self.assertIsNone(_pager_command())
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "pipe sizes are Linux-only")
+    def test_grow_pipe(self):
+        """Test that the pipe to less is enlarged."""
+        import fcntl
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        
+        _grow_pipe(write_fd)
+        
+        # Unprivileged users are capped at fs.pipe-max-size
+        with open('/proc/sys/fs/pipe-max-size') as f:
+            limit = int(f.read())
+        size = fcntl.fcntl(write_fd, getattr(fcntl, 'F_GETPIPE_SZ', 1032))
+        self.assertGreaterEqual(size, min(PIPE_SIZE, limit))
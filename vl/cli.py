@@ -1,6 +1,7 @@
 """Command-line interface for the VL CSV viewer."""
 
 import argparse
+import os
 import sys
 from typing import List, Optional
 
@@ -11,11 +12,13 @@ except ImportError:
     # argcomplete is optional
     argcomplete = None
 
-from .formatter import view_csv
 
+# Parser shared by every parse_args call, built on first use
+_PARSER: Optional[argparse.ArgumentParser] = None
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
-    """Parse command-line arguments."""
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI."""
     parser = argparse.ArgumentParser(
         description='An ultrafast CSV viewer in terminals',
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -92,6 +95,21 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help='Regex pattern to identify comment lines (default: "^#")',
     )
     
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the shared argument parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = _get_parser()
+    
     # Register parser with argcomplete if available
     if argcomplete:
         argcomplete.autocomplete(parser)
@@ -99,6 +117,28 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
+def view_csv(**kwargs) -> None:
+    """
+    View a CSV file with the formatter's view_csv.
+    
+    The formatter is imported here rather than at module level, so that
+    --help and argument errors return without loading it.
+    """
+    from .formatter import view_csv as _view_csv
+    _view_csv(**kwargs)
+
+
+def _discard_stdout() -> None:
+    """Point stdout at devnull so the interpreter's final flush cannot fail."""
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except (OSError, ValueError):
+        # stdout has no file descriptor (e.g. captured in tests)
+        pass
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """Run the VL CSV viewer CLI."""
     try:
@@ -142,6 +182,10 @@ def main(args: Optional[List[str]] = None) -> int:
         
         return 0
         
+    except BrokenPipeError:
+        # The reader went away (e.g. `vl big.csv | head`); stop quietly
+        _discard_stdout()
+        return 0
     except FileNotFoundError as e:
         print(f"Error: File not found - {e}", file=sys.stderr)
         return 1
@@ -1,10 +1,15 @@
 """Core functionality for formatting CSV data as tables with streaming processing."""
 
+import codecs
 import csv
+import io
+import locale
+import mmap
 import os
 import re
 import shutil
 import sys
+from itertools import chain, islice, repeat, zip_longest
 from typing import List, Optional, Dict, Tuple, Iterator, Pattern
 
 
@@ -35,9 +40,38 @@ class CSVViewer:
         'bg_white': '\033[47m',
     }
     
+    # Border characters for each table style
+    BORDER_STYLES = {
+        'simple': {
+            'h': '-', 'v': '|', 'tl': '+', 'tr': '+', 'bl': '+', 'br': '+',
+            'lc': '+', 'rc': '+', 'tc': '+', 'bc': '+', 'c': '+'
+        },
+        'grid': {
+            'h': '─', 'v': '│', 'tl': '┌', 'tr': '┐', 'bl': '└', 'br': '┘',
+            'lc': '├', 'rc': '┤', 'tc': '┬', 'bc': '┴', 'c': '┼'
+        },
+        'minimal': {
+            'h': '─', 'v': ' ', 'tl': ' ', 'tr': ' ', 'bl': ' ', 'br': ' ',
+            'lc': ' ', 'rc': ' ', 'tc': ' ', 'bc': ' ', 'c': ' '
+        },
+        'none': {
+            'h': ' ', 'v': ' ', 'tl': ' ', 'tr': ' ', 'bl': ' ', 'br': ' ',
+            'lc': ' ', 'rc': ' ', 'tc': ' ', 'bc': ' ', 'c': ' '
+        },
+    }
+    
     # Default colors for the alternating columns mode
     DEFAULT_COLUMN_COLORS = ['bg_cyan', 'bg_white']
 
+    # Marker appended to cells cut down to the maximum column width
+    ELLIPSIS = '…'
+
+    # Number of formatted rows collected before each write to the output stream
+    WRITE_BATCH_ROWS = 1024
+
+    # Size of the blocks the file and stream readers decode and split at once
+    READ_BLOCK_SIZE = 1 << 20
+
     def __init__(
         self,
         delimiter: str = ',',
@@ -50,6 +84,7 @@ class CSVViewer:
         column_colors: Optional[List[str]] = None,
         ignore_comments: bool = False,
         comment_pattern: str = '^#',
+        sample_rows: int = 100,
     ):
         """
         Initialize the CSV viewer.
@@ -65,6 +100,7 @@ class CSVViewer:
             column_colors: List of color names for alternating columns when use_colors is True
             ignore_comments: Whether to ignore lines matching the comment pattern
             comment_pattern: Regex pattern to identify comment lines (default: "^#")
+            sample_rows: Number of leading rows used to size the columns
         """
         self.delimiter = delimiter
         self.header = header
@@ -72,7 +108,11 @@ class CSVViewer:
         self.max_col_width = max_col_width
         self.border_style = border_style
         self.output_stream = output_stream or sys.stdout
-        self.term_height, self.term_width = self._get_terminal_size()
+        self.sample_rows = sample_rows
+
+        # Terminal size is probed on first access rather than per viewer
+        self._term_height = None
+        self._term_width = None
         
         # Color settings
         self.use_colors = use_colors
@@ -84,37 +124,63 @@ class CSVViewer:
         
         # Border characters for different styles
         self.border_chars = self._get_border_chars()
+        
+        # Separator lines keyed by (column widths, position, border characters)
+        self._separator_cache = {}
+        
+        # Row format template, rebuilt whenever the column widths or the
+        # settings baked into it change
+        self._row_template = ''
+        self._row_template_key = None
+        self._row_template_widths = None
+        
+        # csv dialect shared by every reader, built on first use
+        self._dialect = None
+        
+        # Called by the stream readers before each read that may block, so
+        # rows formatted so far are written out while input trickles in
+        self._on_input_wait = None
 
     def _get_terminal_size(self) -> Tuple[int, int]:
-        """Get the current terminal size."""
+        """Get the current terminal size as (height, width)."""
         try:
-            height, width = shutil.get_terminal_size()
-            return height, width
+            size = shutil.get_terminal_size((80, 24))
+            return size.lines, size.columns
         except Exception:
             # Fallback to reasonable defaults if we can't get terminal size
             return 24, 80
 
+    def refresh_terminal_size(self) -> None:
+        """Probe the terminal size again, e.g. after the terminal was resized."""
+        self._term_height, self._term_width = self._get_terminal_size()
+
+    @property
+    def term_height(self) -> int:
+        """Terminal height in lines, probed once on first access."""
+        if self._term_height is None:
+            self.refresh_terminal_size()
+        return self._term_height
+
+    @term_height.setter
+    def term_height(self, value: int) -> None:
+        self._term_height = value
+
+    @property
+    def term_width(self) -> int:
+        """Terminal width in columns, probed once on first access."""
+        if self._term_width is None:
+            self.refresh_terminal_size()
+        return self._term_width
+
+    @term_width.setter
+    def term_width(self, value: int) -> None:
+        self._term_width = value
+
     def _get_border_chars(self) -> Dict[str, Dict[str, str]]:
         """Get the border characters based on the selected style."""
-        styles = {
-            'simple': {
-                'h': '-', 'v': '|', 'tl': '+', 'tr': '+', 'bl': '+', 'br': '+',
-                'lc': '+', 'rc': '+', 'tc': '+', 'bc': '+', 'c': '+'
-            },
-            'grid': {
-                'h': '─', 'v': '│', 'tl': '┌', 'tr': '┐', 'bl': '└', 'br': '┘',
-                'lc': '├', 'rc': '┤', 'tc': '┬', 'bc': '┴', 'c': '┼'
-            },
-            'minimal': {
-                'h': '─', 'v': ' ', 'tl': ' ', 'tr': ' ', 'bl': ' ', 'br': ' ',
-                'lc': ' ', 'rc': ' ', 'tc': ' ', 'bc': ' ', 'c': ' '
-            },
-            'none': {
-                'h': ' ', 'v': ' ', 'tl': ' ', 'tr': ' ', 'bl': ' ', 'br': ' ',
-                'lc': ' ', 'rc': ' ', 'tc': ' ', 'bc': ' ', 'c': ' '
-            }
-        }
-        return styles.get(self.border_style, styles['simple'])
+        styles = self.BORDER_STYLES
+        # Copy, so that changes to one viewer's border_chars stay local
+        return dict(styles.get(self.border_style, styles['simple']))
 
     def _is_comment_line(self, row: List[str]) -> bool:
         """
@@ -145,17 +211,438 @@ class CSVViewer:
         """
         # If file_input is a string, it's a file path
         if isinstance(file_input, str):
-            with open(file_input, 'r', newline='') as f:
-                reader = csv.reader(f, delimiter=self.delimiter)
-                for row in reader:
-                    if not self._is_comment_line(row):
-                        yield row
+            if len(self.delimiter) == 1 and self._locale_is_utf8():
+                rows = self._mmap_reader(file_input)
+            else:
+                # Let the csv module report unsupported delimiters as before,
+                # and decode other locale encodings the way open() does
+                rows = self._text_reader(file_input)
         # Otherwise treat it as a file-like object (e.g., stdin)
+        elif len(self.delimiter) == 1:
+            if self._is_utf8_text_stream(file_input) and self._at_stream_start(file_input):
+                rows = self._stream_reader(file_input.buffer, file_input.errors)
+            else:
+                rows = self._text_stream_reader(file_input)
         else:
-            reader = csv.reader(file_input, delimiter=self.delimiter)
-            for row in reader:
-                if not self._is_comment_line(row):
-                    yield row
+            rows = csv.reader(file_input, self._get_dialect())
+
+        if not self.ignore_comments:
+            yield from rows
+            return
+
+        for row in rows:
+            if not self._is_comment_line(row):
+                yield row
+
+    def _get_dialect(self):
+        """
+        Get the csv dialect for the configured delimiter.
+        
+        The dialect object the C reader builds is cached and passed back to
+        later readers, which then skip validating the format parameters. This
+        matters for sparsely quoted blocks, which start one reader per quoted
+        record.
+        """
+        if self._dialect is None:
+            self._dialect = csv.reader((), delimiter=self.delimiter).dialect
+        return self._dialect
+
+    def _text_reader(self, file_path: str) -> Iterator[List[str]]:
+        """Read a CSV file through the stdlib csv reader in text mode."""
+        with open(file_path, 'r', newline='') as f:
+            yield from csv.reader(f, self._get_dialect())
+
+    @staticmethod
+    def _locale_is_utf8() -> bool:
+        """Check whether files opened in text mode would be decoded as UTF-8."""
+        try:
+            return codecs.lookup(locale.getpreferredencoding(False)).name == 'utf-8'
+        except LookupError:
+            return False
+
+    @staticmethod
+    def _is_utf8_text_stream(stream) -> bool:
+        """Check whether a text stream exposes an underlying UTF-8 byte buffer."""
+        if getattr(stream, 'buffer', None) is None:
+            return False
+        try:
+            return codecs.lookup(stream.encoding).name == 'utf-8'
+        except (AttributeError, TypeError, LookupError):
+            return False
+
+    @staticmethod
+    def _at_stream_start(stream) -> bool:
+        """
+        Check whether a text stream can safely be read through its byte buffer.
+        
+        The text layer reads ahead, so once anything has been read from it the
+        byte buffer is already past data the caller has not seen. That is ruled
+        out for the untouched sys.stdin, and for seekable streams still at
+        their start, which are rewound to drop any read-ahead.
+        """
+        if stream is sys.stdin:
+            return True
+        try:
+            if not stream.seekable() or stream.tell() != 0:
+                return False
+            stream.seek(0)
+        except (AttributeError, OSError, ValueError):
+            return False
+        return True
+
+    def _text_stream_reader(self, stream) -> Iterator[List[str]]:
+        """
+        Read a CSV text stream in large chunks.
+        
+        Used for text streams that cannot be read through a UTF-8 byte buffer.
+        
+        Args:
+            stream: Text file-like object
+            
+        Yields:
+            Each row of the stream as a list of strings
+        """
+        rest = yield from self._split_blocks(self._iter_text_blocks(stream))
+        if rest is not None:
+            # Finish the partial line, then let csv.reader take the stream's
+            # own lines
+            head = io.StringIO(rest + stream.readline(), newline='')
+            yield from csv.reader(chain(head, stream), self._get_dialect())
+
+    def _iter_text_blocks(self, stream) -> Iterator[str]:
+        """
+        Read a text stream in blocks that end on a record boundary.
+        
+        The text counterpart of _iter_stream_blocks.
+        
+        Args:
+            stream: Text file-like object
+            
+        Yields:
+            Blocks of complete records
+            
+        Returns:
+            The text read but not emitted when a block cannot be cut on its own
+            (see _can_split), or None once the stream is exhausted
+        """
+        pending = ''
+        while True:
+            if self._on_input_wait is not None:
+                self._on_input_wait()
+            chunk = stream.read(self.READ_BLOCK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+
+            # Everything before the new chunk is a single partial record
+            cut = pending.rfind('\n', len(pending) - len(chunk)) + 1
+            if not cut:
+                continue
+
+            block = pending[:cut]
+            if not self._can_split(block):
+                return pending
+            yield block
+            pending = pending[cut:]
+
+        if pending:
+            yield pending
+        return None
+
+    def _stream_reader(self, raw, errors: str = 'strict') -> Iterator[List[str]]:
+        """
+        Read a CSV byte stream in large blocks.
+        
+        Used for inputs that cannot be memory-mapped, such as pipes and stdin.
+        
+        Args:
+            raw: Binary file-like object
+            errors: Error handling scheme for decoding UTF-8
+            
+        Yields:
+            Each row of the stream as a list of strings
+        """
+        rest = yield from self._split_blocks(self._iter_stream_blocks(raw), errors)
+        if rest is not None:
+            yield from csv.reader(self._iter_lines(rest, raw, errors),
+                                  self._get_dialect())
+
+    def _iter_stream_blocks(self, raw) -> Iterator[bytes]:
+        """
+        Read a byte stream in blocks that end on a record boundary.
+        
+        Each read fetches up to READ_BLOCK_SIZE bytes. Everything up to the
+        last newline is emitted and the trailing partial record is carried
+        over to the next read. Buffered streams are read with read1(), which
+        returns whatever is available instead of waiting for a full block, so
+        rows arriving slowly through a pipe are shown as they come.
+        
+        Args:
+            raw: Binary file-like object
+            
+        Yields:
+            Raw blocks of complete records
+            
+        Returns:
+            The bytes read but not emitted when a block cannot be cut on its
+            own (see _can_split), or None once the stream is exhausted
+        """
+        pending = bytearray()
+        read = getattr(raw, 'read1', raw.read)
+        while True:
+            if self._on_input_wait is not None:
+                self._on_input_wait()
+            chunk = read(self.READ_BLOCK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+
+            # Everything before the new chunk is a single partial record
+            cut = pending.rfind(b'\n', len(pending) - len(chunk)) + 1
+            if not cut:
+                continue
+
+            block = bytes(pending[:cut])
+            if not self._can_split(block):
+                return bytes(pending)
+            yield block
+            del pending[:cut]
+
+        if pending:
+            yield bytes(pending)
+        return None
+
+    def _mmap_reader(self, file_path: str) -> Iterator[List[str]]:
+        """
+        Read a CSV file through a read-only memory map.
+        
+        The mapping is cut into blocks of complete records which are decoded
+        and split in one go, instead of feeding the csv state machine one
+        character at a time. Files that cannot be mapped (empty files, pipes,
+        character devices) are read in blocks instead.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Yields:
+            Each row of the CSV file as a list of strings
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None
+
+            if mm is None:
+                yield from self._stream_reader(f)
+                return
+
+            with mm:
+                # The map is scanned front to back once; let the kernel read
+                # ahead aggressively (madvise needs Python 3.8+ and POSIX)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                pos = yield from self._split_blocks(self._iter_mmap_blocks(mm))
+
+            if pos is not None:
+                f.seek(pos)
+                yield from csv.reader(self._iter_lines(b'', f), self._get_dialect())
+
+    def _iter_mmap_blocks(self, mm: mmap.mmap) -> Iterator[bytes]:
+        """
+        Cut a memory-mapped file into blocks that end on a record boundary.
+        
+        Each block ends just after a newline. Cutting stops at the first block
+        that cannot be split on its own (see _can_split).
+        
+        Args:
+            mm: Memory-mapped file contents
+            
+        Yields:
+            Raw blocks of complete records
+            
+        Returns:
+            Offset of the first block that was not emitted, or None once the
+            whole map has been emitted
+        """
+        pos = 0
+        size = len(mm)
+        while pos < size:
+            end = mm.rfind(b'\n', pos, pos + self.READ_BLOCK_SIZE) + 1
+            if not end:
+                # Single record longer than the block size
+                end = mm.find(b'\n', pos + self.READ_BLOCK_SIZE) + 1 or size
+
+            block = mm[pos:end]
+            if not self._can_split(block):
+                return pos
+            yield block
+            pos = end
+        return None
+
+    def _split_blocks(self, blocks: Iterator[bytes], errors: str = 'strict') -> Iterator[List[str]]:
+        """
+        Decode and split the blocks of a block iterator.
+        
+        Args:
+            blocks: Generator of raw or already decoded blocks, such as
+                _iter_mmap_blocks
+            errors: Error handling scheme for decoding UTF-8
+            
+        Yields:
+            Each row of the blocks as a list of strings
+            
+        Returns:
+            Whatever the block generator returned
+        """
+        while True:
+            try:
+                block = next(blocks)
+            except StopIteration as stop:
+                return stop.value
+            if not isinstance(block, str):
+                block = block.decode('utf-8', errors)
+            yield from self._split_block(block)
+
+    def _can_split(self, block) -> bool:
+        """
+        Check whether a block of lines can be split on its own.
+        
+        It cannot when it ends inside a quoted field, or when it holds so many
+        quotes that finding out would cost more than parsing it with the csv
+        module. Quote state follows csv.reader's rules for the default
+        quoting: a quote opens a quoted field only at the start of a field, a
+        doubled quote inside one is a literal quote, and any other quote
+        closes it. Quotes in the middle of an unquoted field (``55" screen``)
+        are plain characters.
+        
+        Args:
+            block: Raw or decoded records, starting on a record boundary
+            
+        Returns:
+            True if the block ends on a record boundary outside quotes
+        """
+        if isinstance(block, str):
+            quote, newlines, delimiter = '"', ('\n', '\r'), self.delimiter
+        else:
+            quote, newlines = b'"', (b'\n', b'\r')
+            delimiter = self.delimiter.encode('utf-8')
+
+        quotes = block.count(quote)
+        if not quotes:
+            return True
+        if quotes * 8 > block.count(newlines[0]):
+            return False
+
+        width = len(delimiter)
+        in_quotes = False
+        i = block.find(quote)
+        while i >= 0:
+            if in_quotes:
+                if block[i + 1:i + 2] == quote:
+                    # Escaped quote inside the field
+                    i += 1
+                else:
+                    in_quotes = False
+            elif (i == 0 or block[i - 1:i] in newlines
+                  or (i >= width and block[i - width:i] == delimiter)):
+                in_quotes = True
+            i = block.find(quote, i + 1)
+        return not in_quotes
+
+    def _iter_lines(self, rest: bytes, raw, errors: str = 'strict') -> Iterator[str]:
+        """
+        Decode the rest of a byte stream into lines for a streaming csv.reader.
+        
+        Used once the input can no longer be cut into blocks cheaply, so
+        densely quoted input and quoted fields spanning many lines are read
+        at the csv module's pace without growing a block in memory. Lines are
+        split like a file opened with newline='', and each is handed out as
+        soon as its line ending has been read.
+        
+        Args:
+            rest: Bytes already read from raw, starting on a record boundary
+            raw: Binary file-like object positioned just after rest
+            errors: Error handling scheme for decoding UTF-8
+            
+        Yields:
+            Each remaining line, including its line ending
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors)
+        read = getattr(raw, 'read1', raw.read)
+        partial = ''
+        data = rest or read(self.READ_BLOCK_SIZE)
+        while data:
+            text = partial + decoder.decode(data)
+            if '\n' in text or '\r' in text:
+                lines = io.StringIO(text, newline='').readlines()
+                # A trailing '\r' may still be followed by '\n'
+                partial = '' if lines[-1].endswith('\n') else lines.pop()
+                yield from lines
+            else:
+                partial = text
+            if self._on_input_wait is not None:
+                self._on_input_wait()
+            data = read(self.READ_BLOCK_SIZE)
+
+        partial += decoder.decode(b'', final=True)
+        if partial:
+            yield partial
+
+    def _split_block(self, text: str) -> Iterator[List[str]]:
+        """
+        Split a decoded block of complete records into rows.
+        
+        Quote-free lines are split with ``str.split``, which runs entirely in
+        C. Records containing quotes go through ``csv.reader`` so quoted
+        delimiters and embedded newlines keep their usual meaning. When only
+        a few lines contain quotes, just those records are handed to the csv
+        module; densely quoted blocks are parsed by a single ``csv.reader``
+        pass instead.
+        
+        Args:
+            text: Decoded block ending on a record boundary
+            
+        Yields:
+            Each row of the block as a list of strings
+        """
+        delimiter = self.delimiter
+        dialect = self._get_dialect()
+        quotes = text.count('"')
+        if quotes and ('\r' in text or not text.endswith('\n')
+                       or quotes * 8 > text.count('\n')):
+            yield from csv.reader(io.StringIO(text, newline=''), dialect)
+            return
+
+        if '\r' in text:
+            # Without quotes every carriage return terminates a record
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        lines = text.split('\n')
+        if not lines[-1]:
+            lines.pop()
+
+        # Rows are yielded one at a time rather than collected per block, so
+        # only the row being rendered stays alive
+        if not quotes:
+            if '' in lines:
+                for line in lines:
+                    yield line.split(delimiter) if line else []
+            else:
+                # Common case: no blank lines, so every line maps straight
+                # to str.split without a per-line branch in Python
+                yield from map(str.split, lines, repeat(delimiter))
+            return
+
+        lines = iter(lines)
+        for line in lines:
+            if '"' not in line:
+                yield line.split(delimiter) if line else []
+            else:
+                # csv.reader pulls continuation lines from the shared iterator
+                # only while a quoted field is still open
+                continuation = (next_line + '\n' for next_line in lines)
+                yield next(csv.reader(chain([line + '\n'], continuation), dialect))
 
     def _calculate_initial_col_widths(self, reader: Iterator[List[str]], num_preview_rows: int = 100) -> List[int]:
         """
@@ -171,23 +658,14 @@ class CSVViewer:
         Returns:
             List of column widths
         """
-        col_widths = []
-        rows_buffer = []
+        # islice stops before pulling the row after the preview, so that row
+        # is still there for the caller to render
+        rows_buffer = list(islice(reader, num_preview_rows))
         
-        # Process rows for preview
-        for i, row in enumerate(reader):
-            if i >= num_preview_rows:
-                break
-                
-            rows_buffer.append(row)
-            
-            # Update column widths based on this row
-            for j, cell in enumerate(row):
-                cell_str = str(cell)
-                if j >= len(col_widths):
-                    col_widths.append(len(cell_str))
-                else:
-                    col_widths[j] = max(col_widths[j], len(cell_str))
+        # Reduce column by column: zip_longest transposes the preview (short
+        # rows padded with empty cells) and each max(map(len, ...)) runs in C
+        col_widths = [max(map(len, column))
+                      for column in zip_longest(*rows_buffer, fillvalue='')]
         
         # Apply min/max column width constraints
         col_widths = [max(self.min_col_width, w) for w in col_widths]
@@ -200,7 +678,7 @@ class CSVViewer:
         """Truncate a cell to the specified width if needed."""
         if not width or len(cell) <= width:
             return cell
-        return cell[:width - 1] + '…'
+        return cell[:width - 1] + self.ELLIPSIS
 
     def _get_color(self, col_index: int) -> str:
         """Get the color code for a given column index."""
@@ -211,64 +689,132 @@ class CSVViewer:
         color_name = self.column_colors[col_index % len(self.column_colors)]
         return self.COLORS.get(color_name, "")
 
-    def _format_row(self, row: List[str], col_widths: List[int]) -> str:
-        """Format a single row of data for display."""
-        border_chars = self.border_chars
-        cells = []
+    def _get_row_template(self, col_widths: List[int]) -> str:
+        """
+        Get the ``str.format`` template for rows with the given column widths.
         
-        # Ensure we don't process more columns than we have widths for
-        # This prevents inconsistent line lengths when rows have different numbers of columns
-        process_cols = min(len(row), len(col_widths))
+        The template bakes the border characters, cell padding and, in color
+        mode, each column's ANSI escape codes into a single format string, so
+        a row is rendered with one ``str.format`` call and no per-cell color
+        lookups. It is rebuilt only when the column widths, the vertical border
+        character or the color settings change.
         
-        for i in range(process_cols):
-            cell = str(row[i])
-            width = col_widths[i]
-            
-            # First truncate if needed (this ensures all cells in a column have the same effective width)
-            if self.max_col_width and len(cell) > self.max_col_width:
-                cell = self._truncate_cell(cell, self.max_col_width)
+        Args:
+            col_widths: Column widths the template should pad to
             
-            # Ensure the cell is exactly the width specified in col_widths
-            if self.use_colors:
-                # Apply color to the cell
-                color_code = self._get_color(i)
-                formatted_cell = f"{color_code} {cell:<{width}} {self.COLORS['reset']}"
-                cells.append(formatted_cell)
-            else:
-                # Standard formatting without colors
-                cells.append(f" {cell:<{width}} ")
-        
-        # Add empty cells if row has fewer columns than col_widths
-        for i in range(process_cols, len(col_widths)):
-            if self.use_colors:
-                color_code = self._get_color(i)
-                formatted_cell = f"{color_code} {'':<{col_widths[i]}} {self.COLORS['reset']}"
-                cells.append(formatted_cell)
-            else:
-                cells.append(f" {'':<{col_widths[i]}} ")
-        
-        # Join cells with vertical border character
-        return border_chars['v'] + border_chars['v'].join(cells) + border_chars['v']
+        Returns:
+            Format string with one positional field per column
+        """
+        # view_csv passes the same widths tuple for every row of a render, so
+        # the identity check settles the common case without building the key
+        if col_widths is not self._row_template_widths:
+            key = (tuple(col_widths), self.border_chars['v'],
+                   self.use_colors, tuple(self.column_colors))
+            if key != self._row_template_key:
+                v = self.border_chars['v']
+                cells = [f" {{:<{width}}} " for width in col_widths]
+                if self.use_colors:
+                    reset = self.COLORS['reset']
+                    cells = [self._get_color(i) + cell + reset for i, cell in enumerate(cells)]
+                self._row_template = v + v.join(cells) + v
+                self._row_template_key = key
+            if isinstance(col_widths, tuple):
+                self._row_template_widths = col_widths
+        return self._row_template
+
+    def _format_row(self, row: List[str], col_widths: List[int]) -> str:
+        """Format a single row of data for display."""
+        # Fit the row to the number of columns: extra cells are dropped and
+        # missing cells are rendered empty, keeping every line the same length
+        num_cols = len(col_widths)
+        if len(row) != num_cols:
+            row = row[:num_cols] + [''] * (num_cols - len(row))
+
+        # Truncate first so that all cells in a column have the same effective width
+        # The slice is inlined rather than calling _truncate_cell per cell
+        max_width = self.max_col_width
+        if max_width:
+            cut = max_width - 1
+            ellipsis = self.ELLIPSIS
+            row = [cell[:cut] + ellipsis if len(cell) > max_width else cell for cell in row]
+
+        return self._get_row_template(col_widths).format(*row)
 
     def _format_separator(self, col_widths: List[int], position: str) -> str:
         """Format a horizontal separator line for the table."""
         if self.border_style == 'none':
             return ''
             
-        border_chars = self.border_chars
-        parts = []
-        
-        for width in col_widths:
-            parts.append(border_chars['h'] * (width + 2))  # +2 for padding
+        bc = self.border_chars
+        key = (tuple(col_widths), position, tuple(bc.items()))
+        separator = self._separator_cache.get(key)
+        if separator is not None:
+            return separator
         
         if position == 'top':
-            return border_chars['tl'] + border_chars['tc'].join(parts) + border_chars['tr']
+            left, junction, right = bc['tl'], bc['tc'], bc['tr']
         elif position == 'middle':
-            return border_chars['lc'] + border_chars['c'].join(parts) + border_chars['rc']
+            left, junction, right = bc['lc'], bc['c'], bc['rc']
         elif position == 'bottom':
-            return border_chars['bl'] + border_chars['bc'].join(parts) + border_chars['br']
+            left, junction, right = bc['bl'], bc['bc'], bc['br']
         else:
             return ''
+        
+        h = bc['h']
+        separator = left + junction.join([h * (width + 2) for width in col_widths]) + right  # +2 for padding
+        self._separator_cache[key] = separator
+        return separator
+
+    def _render_rows(self, rows: Iterator[List[str]], col_widths: List[int]) -> int:
+        """
+        Format rows and write them to the output stream in batches.
+        
+        Rows are consumed lazily and written every WRITE_BATCH_ROWS rows with
+        a single write() call, so memory stays bounded by one batch and the
+        first rows appear before the rest of the file is read. A partial batch
+        is also written whenever a stream reader is about to wait for more
+        input, so slowly piped rows are shown as they come.
+        
+        Args:
+            rows: Iterable of rows to render
+            col_widths: Column widths to format the rows with
+            
+        Returns:
+            Number of rows written
+        """
+        # Bound once so the loop body does no attribute lookups
+        format_row = self._format_row
+        write = self.output_stream.write
+        flush = self.output_stream.flush
+        batch_rows = self.WRITE_BATCH_ROWS
+        batch = []
+        append = batch.append
+        count = 0
+        
+        def write_batch():
+            nonlocal count
+            if batch:
+                write('\n'.join(batch) + '\n')
+                # Push each batch out so a closed pipe (`vl big.csv | head`)
+                # raises BrokenPipeError now instead of after the whole file
+                flush()
+                count += len(batch)
+                batch.clear()
+        
+        # Settings may have changed since the last render; check the template
+        # key again on the first row
+        self._row_template_widths = None
+        self._on_input_wait = write_batch
+        try:
+            for row in rows:
+                append(format_row(row, col_widths))
+                if len(batch) >= batch_rows:
+                    write_batch()
+        finally:
+            self._on_input_wait = None
+        
+        write_batch()
+        return count
 
     def view_csv(self, file_input) -> None:
         """
@@ -280,23 +826,22 @@ class CSVViewer:
         reader = self._csv_reader(file_input)
 
         # Calculate initial column widths from preview rows
-        col_widths, preview_rows = self._calculate_initial_col_widths(reader)
+        col_widths, preview_rows = self._calculate_initial_col_widths(reader, self.sample_rows)
+        
+        # Widths are fixed for the rest of the render; an immutable tuple can
+        # be matched against the cached row template by identity
+        col_widths = tuple(col_widths)
 
-        # Print top border
+        # The top border, header and header separator go out in one write
+        head = []
         if self.border_style != 'none':
-            top_border = self._format_separator(col_widths, 'top')
-            print(top_border, file=self.output_stream)
+            head.append(self._format_separator(col_widths, 'top'))
         
-        # Print header (if exists)
+        # Header (if exists)
         if preview_rows and self.header:
-            header_row = preview_rows[0]
-            header_str = self._format_row(header_row, col_widths)
-            print(header_str, file=self.output_stream)
-            
-            # Print header separator
+            head.append(self._format_row(preview_rows[0], col_widths))
             if self.border_style != 'none':
-                separator = self._format_separator(col_widths, 'middle')
-                print(separator, file=self.output_stream)
+                head.append(self._format_separator(col_widths, 'middle'))
             
             # Start printing data rows from the second row
             start_idx = 1
@@ -304,26 +849,19 @@ class CSVViewer:
             # No header, start from the first row
             start_idx = 0
         
-        # Print preview rows
-        for i in range(start_idx, len(preview_rows)):
-            row_str = self._format_row(preview_rows[i], col_widths)
-            print(row_str, file=self.output_stream)
+        if head:
+            self.output_stream.write('\n'.join(head) + '\n')
         
-        # Continue with the rest of the file
-        row_count = len(preview_rows)
-        for row in reader:
-            row_str = self._format_row(row, col_widths)
-            print(row_str, file=self.output_stream)
-            row_count += 1
+        # Print preview rows, then stream the rest of the file with the
+        # widths measured on the preview
+        self._render_rows(preview_rows[start_idx:], col_widths)
+        row_count = len(preview_rows) + self._render_rows(reader, col_widths)
         
-        # Print bottom border
+        # Bottom border and summary, also in one write
+        tail = f"\nTotal rows: {row_count}\n"
         if self.border_style != 'none':
-            bottom_border = self._format_separator(col_widths, 'bottom')
-            print(bottom_border, file=self.output_stream)
-            
-        # Print summary
-        print(f"\nTotal rows: {row_count}", file=self.output_stream)
-
+            tail = self._format_separator(col_widths, 'bottom') + '\n' + tail
+        self.output_stream.write(tail)
 
 def view_csv(
     file_path: Optional[str] = None,
@@ -1,6 +1,8 @@
 """Command-line interface for the VL CSV viewer with pager support."""
 
+import io
 import os
+import shlex
 import sys
 import subprocess
 from . import cli
@@ -15,24 +17,100 @@ def sigpipe_handler(signum, frame):
     # Just exit silently when pipe is broken
     sys.exit(0)
 
+# Size requested for the pipe to less (Linux caps it at fs.pipe-max-size,
+# 1 MiB by default)
+PIPE_SIZE = 1 << 20
+
+def _grow_pipe(fd):
+    """Enlarge a pipe's kernel buffer where the platform supports it."""
+    try:
+        import fcntl
+    except ImportError:
+        return
+    # fcntl.F_SETPIPE_SZ is only exposed from Python 3.10; the value is Linux's
+    setpipe_sz = getattr(fcntl, 'F_SETPIPE_SZ', 1031 if sys.platform.startswith('linux') else None)
+    if setpipe_sz is None:
+        return
+    try:
+        fcntl.fcntl(fd, setpipe_sz, PIPE_SIZE)
+    except OSError:
+        # Above the system limit for unprivileged users; keep the default
+        pass
+
+# Options for less when $LESS is unset: -F quits at once when the table fits
+# on one screen, -X leaves it on the terminal afterwards
+DEFAULT_LESS = 'FX'
+
+def _pager_command():
+    """
+    Get the pager command line from $PAGER, defaulting to less.
+    
+    Returns None when paging is disabled ($PAGER set to an empty string or
+    cat). less always gets -S (chop long lines) and -R (interpret ANSI
+    colors), which the table layout relies on; further options come from
+    $LESS.
+    """
+    pager = os.environ.get('PAGER')
+    if pager is None:
+        pager = 'less'
+    try:
+        cmd = shlex.split(pager)
+    except ValueError:
+        # Unbalanced quotes; fall back to plain whitespace splitting
+        cmd = pager.split()
+    if not cmd or cmd == ['cat']:
+        return None
+    if os.path.basename(cmd[0]) == 'less':
+        cmd.append('-SR')
+    return cmd
+
 def main(args=None):
     """Run the VL CSV viewer and pipe the output through less pager."""
+    # Paging only makes sense on a terminal; when the output is redirected
+    # (e.g. `vll data.csv > out.txt`) or $PAGER disables paging, write
+    # straight to stdout
+    pager_cmd = _pager_command()
+    if pager_cmd is None or not sys.stdout.isatty():
+        return cli.main(args)
+    
     # Create a pipe to less
     old_stdout = sys.stdout
     less_proc = None
+    original_sigint = None
     
     try:
         # Set up SIGPIPE handler to prevent broken pipe errors
         signal.signal(signal.SIGPIPE, sigpipe_handler)
         
-        # Use the less pager with -S (chop long lines) and -R (interpret ANSI colors)
-        less_cmd = ['less', '-SR']
+        # Open the pager process
+        env = dict(os.environ)
+        env.setdefault('LESS', DEFAULT_LESS)
+        try:
+            less_proc = subprocess.Popen(pager_cmd, stdin=subprocess.PIPE, env=env)
+        except OSError as e:
+            # A mistyped $PAGER should not cost the user the output itself
+            print(f"Error: Cannot run pager {pager_cmd[0]} - {e.strerror}; "
+                  "showing output without paging", file=sys.stderr)
+            return cli.main(args)
+        
+        # less shares our process group, so Ctrl-C (e.g. to cancel a search)
+        # reaches us too; leave it to less while it runs. Set after Popen so
+        # less itself does not inherit SIG_IGN.
+        original_sigint = signal.signal(signal.SIGINT, signal.SIG_IGN)
         
-        # Open the less process
-        less_proc = subprocess.Popen(less_cmd, stdin=subprocess.PIPE, universal_newlines=True)
+        # A larger pipe lets the viewer run further ahead of less between
+        # context switches
+        _grow_pipe(less_proc.stdin.fileno())
         
-        # Redirect stdout to the less process
-        sys.stdout = less_proc.stdin
+        # Redirect stdout to the less process. The pipe is opened in binary
+        # mode and wrapped here with stdout's own encoding; write_through
+        # hands each (already batched) write straight to the pipe buffer
+        sys.stdout = io.TextIOWrapper(
+            less_proc.stdin,
+            encoding=old_stdout.encoding or 'utf-8',
+            errors=old_stdout.errors,
+            write_through=True,
+        )
         
         # Run the CLI with the provided arguments
         try:
@@ -100,6 +178,9 @@ def main(args=None):
                 less_proc.wait()
             except:
                 pass
+        
+        if original_sigint is not None:
+            signal.signal(signal.SIGINT, original_sigint)
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file